@@ -22,7 +22,7 @@ form the core of this package. Loads all the relevant kivy files for this packag
 
 ------------------------------------------------------------------------------------------------------------------------
 """
-from kivy.uix.screenmanager import ScreenManager
+from kivy.uix.screenmanager import ScreenManager, Screen
 from kivy.core.window import Window
 from kivy.config import Config
 from kivy.lang import Builder
@@ -63,12 +63,15 @@ class PalilaScreenManager(ScreenManager):
         The linked PalilaExperiment instance.
     answers : PalilaAnswers
         The linked PalilaAnswers instance.
+    lazy_screens : dict[str, callable]
+        Factories of the screens that are only created when they are first needed, linked to the screen names.
     """
 
     def __init__(self, experiment: PalilaExperiment, answers: PalilaAnswers, **kwargs) -> None:
         super().__init__(**kwargs)
         self.experiment = experiment
         self.answers = answers
+        self.lazy_screens = {}
 
         # Go about initialising the Screens based on the input file
         self._initialise_screens()
@@ -139,6 +142,39 @@ class PalilaScreenManager(ScreenManager):
         self.add_widget(EndScreen('main-questionnaire-1', 'final', name='end'))
         self.add_widget(FinalScreen('end', '', goodbye=self.experiment['goodbye'], name='final'))
 
+    def register_lazy(self, name: str, factory: callable) -> None:
+        """
+        Register a screen that is only created and added to this manager when it is first needed.
+
+        Parameters
+        ----------
+        name : str
+            Name of the screen, by which it is navigated to.
+        factory : callable
+            Function without arguments that creates the screen.
+        """
+        self.lazy_screens[name] = factory
+
+    def get_screen(self, name: str) -> Screen:
+        """
+        Overload of get_screen that first creates the screen with the given name if it is registered as a lazy screen.
+        Setting the current screen goes through this method as well, so navigating to a lazy screen creates it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the screen to get.
+
+        Returns
+        -------
+        kivy.uix.screenmanager.Screen
+            The screen with the given name.
+        """
+        if name in self.lazy_screens:
+            self.add_widget(self.lazy_screens.pop(name)())
+
+        return super().get_screen(name)
+
     def navigate_next(self) -> None:
         """
         Navigate to the next screen, based on the string defined in the current screen.
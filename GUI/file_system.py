@@ -28,6 +28,8 @@ import time
 import copy
 import os
 
+from .questionnaire_screen import QUESTION_TYPES
+
 
 __all__ = ['PalilaExperiment', 'PalilaAnswers']
 
@@ -299,9 +301,118 @@ class PalilaExperiment(ConfigObj):
 
         # Store the split dictionary in the questionnaire dictionary
         questionnaire_dict['screen dict'] = screen_dict
+        # ==============================================================================================================
+        # todo: DEPRECATED CODE
+        # ---------------------
+        # Store the dependency relations, so the questions do not have to look them up when they are created
+        questionnaire_dict['dependency dag'] = self._build_dependency_dag(questionnaire_dict)
+        # ==============================================================================================================
+
+        # The questionnaire screens are only built when they are first needed, so verify the questions here
+        self._verify_questionnaire(questionnaire_dict, part)
 
         return questionnaire_dict
 
+    @staticmethod
+    def _verify_questionnaire(questionnaire_dict: Section, part: str) -> None:
+        """
+        Verification of the questions of a prepared questionnaire, so errors show up before the experiment starts.
+
+        Parameters
+        ----------
+        questionnaire_dict : dict
+            The prepared questionnaire dictionary, with the question ids and the 'screen dict' set up.
+        part : str
+            The part of the experiment where this questionnaire is located.
+
+        Raises
+        ------
+        SyntaxError :
+            If a question of the questionnaire is not set up correctly.
+        """
+        # Link the question ids to the screen they are placed on and to their type
+        question_screens = {questionnaire_dict[question]['id']: screen_num
+                            for screen_num, questions in questionnaire_dict['screen dict'].items()
+                            for question in questions}
+        question_types = {questionnaire_dict[question]['id']: questionnaire_dict[question].get('type')
+                          for question in questionnaire_dict['questions']}
+
+        for question in questionnaire_dict['questions']:
+            question_dict = questionnaire_dict[question]
+            # Check that the question has a known type
+            if question_dict.get('type') not in QUESTION_TYPES:
+                raise SyntaxError(f'Experiment {part} questionnaire {question} has unknown question type '
+                                  f'"{question_dict.get("type")}".')
+
+            # Check that the question types with choices have them
+            if question_dict['type'] in ('Spinner', 'MultipleChoice', 'MultiMultipleChoice'):
+                if 'choices' not in question_dict:
+                    raise SyntaxError(f'Experiment {part} questionnaire {question} does not contain '
+                                      f'"choices" variable.')
+
+            # Check that the unlocking question exists on the same screen and is able to unlock this one
+            if 'unlocked by' in question_dict:
+                unlocked_by = question_dict['unlocked by']
+                if 'unlock condition' not in question_dict:
+                    raise SyntaxError(f'Experiment {part} questionnaire {question} does not contain '
+                                      f'"unlock condition" variable.')
+                elif unlocked_by not in question_screens:
+                    raise SyntaxError(f'Experiment {part} questionnaire {question} is unlocked by "{unlocked_by}", '
+                                      f'which is not a question in this questionnaire.')
+                elif question_screens[unlocked_by] != question_screens[question_dict['id']]:
+                    raise SyntaxError(f'Experiment {part} questionnaire {question} is unlocked by "{unlocked_by}", '
+                                      f'which is not on the same screen.')
+                elif question_types[unlocked_by] == 'MultiMultipleChoice':
+                    raise SyntaxError(f'Experiment {part} questionnaire {question} is unlocked by "{unlocked_by}", '
+                                      f'but MultiMultipleChoice questions cannot unlock other questions.')
+
+            # ==========================================================================================================
+            # todo: DEPRECATED CODE
+            # ---------------------
+            # Check that the dependant question exists on the same screen
+            if 'dependant' in question_dict:
+                dependant = question_dict['dependant']
+                if question_screens.get(dependant) != question_screens[question_dict['id']]:
+                    raise SyntaxError(f'Experiment {part} questionnaire {question} has dependant "{dependant}", '
+                                      f'which is not a question on the same screen.')
+            # ==========================================================================================================
+
+    # ==================================================================================================================
+    # todo: DEPRECATED CODE
+    # ---------------------
+    @staticmethod
+    def _build_dependency_dag(questionnaire_dict: Section) -> dict[str, tuple[str, str]]:
+        """
+        Build the dependency relations of the original dependency system from a questionnaire dictionary.
+
+        Parameters
+        ----------
+        questionnaire_dict : dict
+            The questionnaire dictionary, with the 'questions' list and the question ids already set up.
+
+        Returns
+        -------
+        dict[str, tuple[str, str]]
+            Dictionary that links question ids to the id of their dependant question and its unlock condition.
+
+        Raises
+        ------
+        SyntaxError :
+            If a question with a dependant question does not have a "dependant condition".
+        """
+        dependency_dag = dict()
+        for question in questionnaire_dict['questions']:
+            question_dict = questionnaire_dict[question]
+            if 'dependant' in question_dict:
+                if 'dependant condition' not in question_dict:
+                    raise SyntaxError(f'{question_dict["id"]} does not have a "dependant condition" to unlock its '
+                                      f'dependant question.')
+
+                dependency_dag[question_dict['id']] = (question_dict['dependant'], question_dict['dependant condition'])
+
+        return dependency_dag
+    # ==================================================================================================================
+
     def _prepare_part_audio(self, part: str, audio: str, question_overwrite: bool = False) -> None:
         """
         Prepares a specific audio's dictionary.
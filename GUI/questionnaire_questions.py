@@ -24,12 +24,69 @@ from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
 from kivy.uix.widget import Widget
+from kivy.clock import Clock
+import functools
+import math
 
 from .numpad_bubble import NumPadBubble
 
 
 __all__ = ['QuestionnaireQuestion']
 
+# Colors of the question inputs: answered, unanswered and locked by another question, and of the border lines.
+_GREEN = (.5, 1., .5, 1.)
+_WHITE = (1., 1., 1., 1.)
+_LIGHT_GREEN = (.7, 1., .7, 1.)
+_BORDER = (.8, .8, .8, 1.)
+
+
+def _debounce(fn: callable, delay: float = .08) -> callable:
+    """
+    Decorator that postpones a method call until it has not been called again for the given delay.
+    The pending call is stored on the instance, so every new call cancels and re-schedules it.
+    The decorated method gets cancel and flush functions, to drop or immediately run the pending call of an instance:
+    e.g. self.method.flush(self).
+
+    Parameters
+    ----------
+    fn : callable
+        The method to debounce.
+    delay : float, optional
+        Time in seconds to wait for a new call. Defaults to 0.08.
+
+    Returns
+    -------
+    callable
+        The debounced method, with the cancel and flush functions as attributes.
+    """
+    # The pending Kivy ClockEvent and call are stored together on the instance
+    pending_attr = f'_{fn.__name__}_pending'
+
+    def cancel(self) -> None:
+        # Cancel the pending call if there is one
+        pending = getattr(self, pending_attr, None)
+        if pending is not None:
+            pending[0].cancel()
+            setattr(self, pending_attr, None)
+
+    def flush(self) -> None:
+        # Run the pending call right away if there is one
+        pending = getattr(self, pending_attr, None)
+        if pending is not None:
+            cancel(self)
+            pending[1]()
+
+    @functools.wraps(fn)
+    def debounced(self, *args, **kwargs) -> None:
+        cancel(self)
+        # Schedule the call with the latest arguments
+        call = functools.partial(fn, self, *args, **kwargs)
+        setattr(self, pending_attr, (Clock.schedule_once(lambda _: flush(self), delay), call))
+
+    debounced.cancel = cancel
+    debounced.flush = flush
+    return debounced
+
 
 class QuestionnaireChoiceButton(Button):
     """
@@ -39,29 +96,37 @@ class QuestionnaireChoiceButton(Button):
     ----------
     text : str, optional
         For setting the Button.text through calling in Python.
+    owner : QuestionnaireQuestion, optional
+        The question this button belongs to.
     **kwargs
         Keyword arguments. These are passed on to the kivy.uix.button.Button constructor.
+
+    Attributes
+    ----------
+    owner : QuestionnaireQuestion
+        The question this button belongs to.
     """
-    def __init__(self, text: str = '', **kwargs):
+    def __init__(self, text: str = '', owner=None, **kwargs):
         super().__init__(text=text, **kwargs)
+        self.owner = owner
 
     def select(self) -> None:
         """
         Change the color to reflect his button is selected.
         """
-        self.background_color = [.5, 1., .5, 1.]
+        self.background_color = _GREEN
 
     def deselect(self) -> None:
         """
         Change the color to reflect his button is deselected.
         """
-        self.background_color = [1., 1., 1., 1.]
+        self.background_color = _WHITE
 
     def on_release(self):
         """
         Select this button on release and communicate this to the QuestionnaireQuestion.
         """
-        self.parent.parent.select_choice(self)
+        self.owner.select_choice(self)
 
 
 class QuestionnaireQuestion(FloatLayout):
@@ -81,6 +146,8 @@ class QuestionnaireQuestion(FloatLayout):
         Dictionary with all the information to construct the question.
     qid : str
         Question ID for communication with the file system.
+    screen : QuestionnaireScreen
+        The screen this question is placed on. Set by the QQuestionManager when the question is added.
     """
 
     bordercolor = ColorProperty([0., 0., 0., 0.])
@@ -88,23 +155,30 @@ class QuestionnaireQuestion(FloatLayout):
     text_width = NumericProperty(.455)
     answer_width = NumericProperty(.545)
 
+    # ==================================================================================================================
+    # todo: DEPRECATED CODE
+    # ---------------------
+    # Class level defaults, which are only overwritten on the instances that actually have a dependant question.
+    dependant = None
+    dependant_condition = None
+    # Flag to only run the original dependency system for questions that actually have a dependant question
+    _has_legacy_dep = False
+    # ==================================================================================================================
+
     def __init__(self, question_dict: dict, **kwargs) -> None:
         super().__init__(**kwargs)
         self.question_dict = question_dict
         self.ids.question_text.text = question_dict['text']
         self.qid = question_dict['id']
+        self.screen = None
 
         self.dependants: list[QuestionnaireQuestion] = list()
-        if 'unlocked by' in question_dict:
-            self.unlock_condition = question_dict['unlock condition']
-        else:
-            self.unlock_condition = None
-        # ==============================================================================================================
-        # todo: DEPRECATED CODE
-        # ---------------------
-        self.dependant = None
-        # ==============================================================================================================
+        # Store the id of the question that unlocks this one, and the condition to do so
+        self._unlocked_by = question_dict.get('unlocked by')
+        self.unlock_condition = question_dict['unlock condition'] if self._unlocked_by is not None else None
         self.answer_temp = ''
+        # Last answer passed on by the input handler, to skip answer changes when the input did not change
+        self._last_answer = ''
 
     def change_answer(self, answer: str) -> None:
         """
@@ -115,12 +189,17 @@ class QuestionnaireQuestion(FloatLayout):
         answer : str
             String form of the answer to store in the answering system.
         """
+        # Nothing has to be updated when the answer did not change
+        if answer == self.parent.answers.get(self.qid):
+            return
+
         # ==============================================================================================================
         # Code for the original dependency system to check if the dependent question should be unlocked
         # todo: DEPRECATED CODE
         # ---------------------
-        if self.dependant is not None:
-            if answer == self.question_dict['dependant condition']:
+        # Only questions with a dependant question of the original system pay for this check.
+        if self._has_legacy_dep:
+            if answer == self.dependant_condition:
                 self.dependant.dependant_unlock()
 
             else:
@@ -128,11 +207,13 @@ class QuestionnaireQuestion(FloatLayout):
         # ==============================================================================================================
 
         # Code for the new dependency system to check if the dependent question(s) should be unlocked
+        # Ensure no unlocks happen with this question disabled. Otherwise, undesired unlocks will happen.
+        # This is checked once, since it is the same for all dependent questions.
+        can_unlock = not self.disabled
         # Loop over all dependent questions
         for question in self.dependants:
             # Check if the unlock condition of this dependent question is met.
-            # Also ensure this does not happen with this question disabled. Otherwise, undesired unlocks will happen.
-            if answer == question.unlock_condition and not self.disabled:
+            if can_unlock and answer == question.unlock_condition:
                 # Unlock the dependant question.
                 question.dependant_unlock()
             else:
@@ -142,13 +223,32 @@ class QuestionnaireQuestion(FloatLayout):
         # Communicate with the question manager
         self.parent.change_answer(self.qid, answer)
 
+    @_debounce
+    def debounced_change_answer(self, answer: str) -> None:
+        """
+        Change the answer related to this question, once the input has settled.
+        For inputs that trigger on every keystroke, to avoid running the dependency and unlock checks every time.
+
+        Parameters
+        ----------
+        answer : str
+            String form of the answer to store in the answering system.
+        """
+        self.change_answer(answer)
+
+    def flush_answer(self) -> None:
+        """
+        Run a pending debounced answer change right away, e.g. before the answers are stored.
+        """
+        self.debounced_change_answer.flush(self)
+
     def set_unlock(self) -> None:
         """
         Add this question to the dependents list of the 'unlocked by' question.
         """
-        if self.unlock_condition is not None:
+        if self._unlocked_by is not None:
             # Add this question to that question's dependents list
-            self.parent.questions[self.question_dict['unlocked by']].assign_dependant(self)
+            self.parent.questions[self._unlocked_by].assign_dependant(self)
             # Lock this question
             self.dependant_lock()
 
@@ -170,18 +270,24 @@ class QuestionnaireQuestion(FloatLayout):
         """
         Add the dependent question to the variable to manage it.
         """
-        if 'dependant' in self.question_dict:
-            if 'dependant condition' not in self.question_dict:
-                raise SyntaxError(f'{self.qid} does not have a "dependant condition" to unlock its dependant question.')
-            else:
-                self.dependant: QuestionnaireQuestion = self.parent.questions[self.question_dict['dependant']]
-                self.dependant.dependant_lock()
+        # Look up the dependency relation, which is set up and verified when loading the questionnaire
+        dependency_dag = self.screen.questionnaire_dict['dependency dag']
+
+        if self.qid in dependency_dag:
+            dependant_id, self.dependant_condition = dependency_dag[self.qid]
+            self.dependant: QuestionnaireQuestion = self.parent.questions[dependant_id]
+            # Switch on the original dependency system in change_answer for this question
+            self._has_legacy_dep = True
+            self.dependant.dependant_lock()
     # ==================================================================================================================
 
     def dependant_lock(self) -> None:
         """
         Lock this question when it is locked by another question.
         """
+        # Make sure a pending answer change does not overwrite the lock
+        self.debounced_change_answer.cancel(self)
+
         # Check if there is already a temporary answer
         if not self.answer_temp:
             # If not, set the current answer as the temporary stored one
@@ -196,6 +302,7 @@ class QuestionnaireQuestion(FloatLayout):
     def dependant_unlock(self) -> None:
         """
         Unlock this question when it is locked by another question.
+        Subclasses only restore their input widgets around this call, the answer itself is changed here only.
         """
         # Enable this question in Kivy
         self.disabled = False
@@ -208,22 +315,22 @@ class QuestionnaireQuestion(FloatLayout):
         """
         Add the top borderline to the question.
         """
-        self.bordercolor = [.8, .8, .8, 1.]
+        self.bordercolor = _BORDER
 
 
 class FreeNumberTextInput(TextInput):
     """
     Subclass of the TextInput to accommodate the NumPad Bubble for entering text with touchscreens.
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
     def on_touch_down(self, touch) -> None:
         """
         Overload of on_touch_down method to trigger the NumPad Bubble.
+        Scrolling and repeated taps while the NumPad Bubble is already coupled to this widget leave it as it is.
         """
-        if self.collide_point(*touch.pos):
-            self.parent.trigger_numpad(self)
+        if not touch.is_mouse_scrolling and self.collide_point(*touch.pos):
+            numpad = self.parent.numpad
+            if numpad is None or numpad.parent is None or numpad.coupled_widget is not self:
+                self.parent.open_numpad(self)
 
         super().on_touch_down(touch)
 
@@ -241,65 +348,85 @@ class FreeNumberQQuestion(QuestionnaireQuestion):
 
     Attributes
     ----------
+    input_bar : FreeNumberTextInput
+        The TextInput in which the number is entered.
+    overlay : kivy.uix.label.Label
+        The Label with the instruction text on top of the TextInput.
     numpad : NumPadBubble
-        Numpad coupled to this Question
+        Numpad coupled to this Question. Only created when it is first needed, and shared by all FreeNumberQQuestions.
     """
 
+    # Only one numpad can be on the screen at a time, so a single one is shared by all instances
+    _shared_numpad = None
+
     def __init__(self, question_dict: dict, **kwargs) -> None:
         super().__init__(question_dict, **kwargs)
-        self.numpad = NumPadBubble()
+        # Get better references to the input widgets
+        self.input_bar: FreeNumberTextInput = self.ids.number_input
+        self.overlay = self.ids.number_overlay
+
+        self.numpad = None
 
     def number_input(self) -> None:
         """
         Function triggered by input in the TextInput bar.
         Checks the full input of the TextInput before changing the answer.
         """
+        text = self.input_bar.text
         # Check if there is text left after the input
-        if self.ids.number_input.text:
+        if text:
             # Check if this text is actually a number.
-            if self.ids.number_input.text.isnumeric():
+            # The input filter already rejects most keyboard input, but still lets through a minus sign.
+            if text.isdecimal():
                 # If so, remove the overlay text and change the color to green.
-                self.ids.number_overlay.text = ''
-                self.ids.number_input.background_color = [.5, 1., .5, 1.]
+                self.overlay.text = ''
+                self.input_bar.background_color = _GREEN
 
             else:
                 # In case it's not a number, revert to the last valid state
-                self.ids.number_input.text = self.answer_temp
+                text = self.answer_temp
+                self.input_bar.text = text
 
         else:
             # If the input bar is empty again, change the color back to white and reset the overlay text.
-            self.ids.number_input.background_color = [1., 1., 1., 1.]
-            self.ids.number_overlay.text = 'Enter a number here.'
+            self.input_bar.background_color = _WHITE
+            self.overlay.text = 'Enter a number here.'
 
-        # After checking everything, change the answer of this question and store it in the temp variable.
-        self.change_answer(self.ids.number_input.text)
-        self.answer_temp = self.ids.number_input.text
+        # After checking everything, change the answer of this question if needed and store it in the temp variable.
+        if text != self._last_answer:
+            self.debounced_change_answer(text)
+            self._last_answer = text
+        self.answer_temp = text
 
-    def trigger_numpad(self, called_with: Widget) -> None:
+    def open_numpad(self, called_with: Widget) -> None:
         """
-        Open or close the numpad and (de)couple it to/from the calling widget.
+        Open the numpad and couple it to the calling widget, moving it there if it is open at another widget.
+        The NumPadBubble closes itself when it is tapped outside of it and the coupled widget.
 
         Parameters
         ----------
         called_with : Widget
             The widget that called for the numpad to be opened.
         """
-        # In case the numpad is not yet coupled and on the screen:
-        if self.numpad.parent is None:
-            # Put it on the screen and couple it.
-            self.parent.parent.add_widget(self.numpad)
-            self.numpad.coupled_widget = called_with
-        else:
-            # Otherwise, remove and decouple.
-            self.parent.parent.remove_widget(self.numpad)
-            self.numpad.coupled_widget = None
+        # Get the shared numpad the first time it is needed, and create it if no other question has done so yet
+        if self.numpad is None:
+            if FreeNumberQQuestion._shared_numpad is None:
+                FreeNumberQQuestion._shared_numpad = NumPadBubble()
+            self.numpad = FreeNumberQQuestion._shared_numpad
+
+        # Take the numpad from wherever it was left behind.
+        if self.numpad.parent is not None:
+            self.numpad.parent.remove_widget(self.numpad)
+        # Put it on the screen and couple it.
+        self.screen.add_widget(self.numpad)
+        self.numpad.coupled_widget = called_with
 
     def dependant_lock(self) -> None:
         """
         Lock this question when it is locked by another question.
         """
-        self.ids.number_overlay.text = ''
-        self.ids.number_input.background_color = [.7, 1., .7, 1.]
+        self.overlay.text = ''
+        self.input_bar.background_color = _LIGHT_GREEN
         super().dependant_lock()
 
     def dependant_unlock(self) -> None:
@@ -320,41 +447,55 @@ class FreeTextQQuestion(QuestionnaireQuestion):
         Dictionary with all the information to construct the question. Should include the following keys: 'id', 'text'.
     **kwargs
         Keyword arguments. These are passed on to the kivy.uix.floatlayout.FloatLayout constructor.
+
+    Attributes
+    ----------
+    input_bar : kivy.uix.textinput.TextInput
+        The TextInput in which the answer is entered.
+    overlay : kivy.uix.label.Label
+        The Label with the instruction text on top of the TextInput.
     """
 
     def __init__(self, question_dict: dict, **kwargs) -> None:
         super().__init__(question_dict, **kwargs)
+        # Get better references to the input widgets
+        self.input_bar: TextInput = self.ids.text_input
+        self.overlay = self.ids.text_overlay
 
     def text_input(self) -> None:
         """
         Function triggered by input in the TextInput bar.
         Checks the full input of the TextInput before changing the answer.
         """
+        text = self.input_bar.text
         # Check if there is text left after the latest input.
-        if self.ids.text_input.text:
+        if text:
             # Check that the text is no more than the supported 2 lines.
-            if len(self.ids.text_input.text.split('\n')) > 2:
+            if text.count('\n') > 1:
                 # If the input results in >2 lines, ignore.
-                self.ids.text_input.text = self.answer_temp
+                text = self.answer_temp
+                self.input_bar.text = text
             # Remove the overlay text and change the bar color to green.
-            self.ids.text_overlay.text = ''
-            self.ids.text_input.background_color = [.5, 1., .5, 1.]
+            self.overlay.text = ''
+            self.input_bar.background_color = _GREEN
 
         else:
             # Otherwise, change the color back to white and reset the overlay message.
-            self.ids.text_input.background_color = [1., 1., 1., 1.]
-            self.ids.text_overlay.text = 'Enter your answer here.'
+            self.input_bar.background_color = _WHITE
+            self.overlay.text = 'Enter your answer here.'
 
-        # Finally, change the stored answer and store it in the temp variable as well.
-        self.change_answer(self.ids.text_input.text)
-        self.answer_temp = self.ids.text_input.text
+        # Finally, change the stored answer if needed and store it in the temp variable as well.
+        if text != self._last_answer:
+            self.debounced_change_answer(text)
+            self._last_answer = text
+        self.answer_temp = text
 
     def dependant_lock(self) -> None:
         """
         Lock this question when it is locked by another question.
         """
-        self.ids.text_overlay.text = ''
-        self.ids.text_input.background_color = [.7, 1., .7, 1.]
+        self.overlay.text = ''
+        self.input_bar.background_color = _LIGHT_GREEN
         super().dependant_lock()
 
     def dependant_unlock(self) -> None:
@@ -375,11 +516,18 @@ class SpinnerQQuestion(QuestionnaireQuestion):
         Dictionary with all the information to construct the question. Should include the following keys: 'id', 'text'.
     **kwargs
         Keyword arguments. These are passed on to the kivy.uix.floatlayout.FloatLayout constructor.
+
+    Attributes
+    ----------
+    spinner : kivy.uix.spinner.Spinner
+        The Spinner with the answer choices.
     """
 
     def __init__(self, question_dict: dict, **kwargs) -> None:
         super().__init__(question_dict, **kwargs)
-        self.ids.spinner.values = question_dict['choices']
+        # Get a better reference to the spinner
+        self.spinner = self.ids.spinner
+        self.spinner.values = question_dict['choices']
 
     def spinner_input(self) -> None:
         """
@@ -387,16 +535,18 @@ class SpinnerQQuestion(QuestionnaireQuestion):
         Checks the full input before changing the answer.
         """
         # Make the spinner green.
-        self.ids.spinner.background_color = [.5, 1., .5, 1.]
-        # Store the answer.
-        self.change_answer(self.ids.spinner.text)
+        self.spinner.background_color = _GREEN
+        # Store the answer, if it changed.
+        if self.spinner.text != self._last_answer:
+            self.change_answer(self.spinner.text)
+            self._last_answer = self.spinner.text
 
     def dependant_lock(self) -> None:
         """
         Lock this question when it is locked by another question.
         """
         super().dependant_lock()
-        self.ids.spinner.background_color = [.7, 1., .7, 1.]
+        self.spinner.background_color = _LIGHT_GREEN
 
     def dependant_unlock(self) -> None:
         """
@@ -406,14 +556,15 @@ class SpinnerQQuestion(QuestionnaireQuestion):
         super().dependant_unlock()
 
 
-class MultipleChoiceQQuestion(QuestionnaireQuestion):
+class ButtonQQuestion(QuestionnaireQuestion):
     """
-    Question type for multiple choice.
+    General class for questions involving choice buttons. Subclass of QuestionnaireQuestion.
 
     Parameters
     ----------
     question_dict: dict
-        Dictionary with all the information to construct the question. Should include the following keys: 'id', 'text'.
+        Dictionary with all the information to construct the question.
+        Should include the following keys: 'id', 'text', 'choices'.
     **kwargs
         Keyword arguments. These are passed on to the kivy.uix.floatlayout.FloatLayout constructor.
 
@@ -421,28 +572,69 @@ class MultipleChoiceQQuestion(QuestionnaireQuestion):
     ----------
     buttons : list[QuestionnaireChoiceButton]
         List of the available choice buttons
-    choice : QuestionnaireChoiceButton = None
-        Currently selected choice button
+    choice_temp
+        Variable to temporarily store the selected choice(s) when this question is locked.
     """
 
     def __init__(self, question_dict: dict, **kwargs) -> None:
         super().__init__(question_dict, **kwargs)
-        self.choice = None
         self.choice_temp = None
 
-        # Add every choice as a button and track their word lengths
+        # Resize the buttons proportional to the square root of the word lengths, such that the hints sum up to 1.
+        roots = [math.sqrt(len(choice)) for choice in question_dict['choices']]
+        inv_total = 1. / sum(roots)
+
+        # Add every choice as a button with its precomputed width
         self.buttons = []
-        lengths = []
-        for choice in question_dict['choices']:
-            choice_button = QuestionnaireChoiceButton(choice)
+        for choice, root in zip(question_dict['choices'], roots):
+            choice_button = QuestionnaireChoiceButton(choice, owner=self, size_hint_x=root * inv_total)
             self.buttons.append(choice_button)
             self.ids.question_input.add_widget(choice_button)
-            lengths.append(len(choice))
 
-        # Resize the buttons proportional to the square root of the word lengths.
-        total = sum(lengths)
-        for ii, length in enumerate(lengths):
-            self.buttons[ii].size_hint_x = length ** .5 / total
+    def dependant_lock(self) -> None:
+        """
+        Lock this question when it is locked by another question.
+        """
+        # Make all the choice buttons green
+        for choice in self.buttons:
+            choice.background_color = _LIGHT_GREEN
+
+        # Do the superclass actions
+        super().dependant_lock()
+
+    def dependant_unlock(self) -> None:
+        """
+        Unlock this question when it is locked by another question.
+        """
+        # Reset all choice buttons
+        for choice in self.buttons:
+            choice.deselect()
+
+        # Do the superclass actions
+        super().dependant_unlock()
+
+
+class MultipleChoiceQQuestion(ButtonQQuestion):
+    """
+    Question type for multiple choice. Subclass of ButtonQQuestion.
+
+    Parameters
+    ----------
+    question_dict: dict
+        Dictionary with all the information to construct the question.
+        Should include the following keys: 'id', 'text', 'choices'.
+    **kwargs
+        Keyword arguments. These are passed on to the kivy.uix.floatlayout.FloatLayout constructor.
+
+    Attributes
+    ----------
+    choice : QuestionnaireChoiceButton = None
+        Currently selected choice button
+    """
+
+    def __init__(self, question_dict: dict, **kwargs) -> None:
+        super().__init__(question_dict, **kwargs)
+        self.choice = None
 
     def select_choice(self, choice: QuestionnaireChoiceButton) -> None:
         """
@@ -475,63 +667,42 @@ class MultipleChoiceQQuestion(QuestionnaireQuestion):
             self.choice_temp = self.choice
         self.choice = None
 
-        for choice in self.buttons:
-            choice.background_color = [.7, 1, .7, 1.]
-
         super().dependant_lock()
 
     def dependant_unlock(self) -> None:
         """
         Unlock this question when it is locked by another question.
         """
-        for choice in self.buttons:
-            choice.deselect()
+        # Unlock first, so the dependent questions are checked with this question enabled.
+        super().dependant_unlock()
 
+        # Reselect the stored choice, of which the answer has just been restored by the unlock.
         if self.choice_temp is not None:
             self.select_choice(self.choice_temp)
             self.choice_temp = None
 
-        super().dependant_unlock()
-
 
-class MultiMultipleChoiceQQuestion(QuestionnaireQuestion):
+class MultiMultipleChoiceQQuestion(ButtonQQuestion):
     """
-    Question type for multiple choice, multiple answer.
-    TODO: figure out a way to merge this with MultipleChoiceQQuestion.
+    Question type for multiple choice, multiple answer. Subclass of ButtonQQuestion.
 
     Parameters
     ----------
     question_dict: dict
-        Dictionary with all the information to construct the question. Should include the following keys: 'id', 'text'.
+        Dictionary with all the information to construct the question.
+        Should include the following keys: 'id', 'text', 'choices'.
     **kwargs
         Keyword arguments. These are passed on to the kivy.uix.floatlayout.FloatLayout constructor.
 
     Attributes
     ----------
-    buttons : list[QuestionnaireChoiceButton]
-        List of the available choice buttons
-    choices : list[QuestionnaireChoiceButton] = []
-        Currently selected choice button(s)
+    choices : dict[QuestionnaireChoiceButton, None] = {}
+        Currently selected choice button(s), as an ordered set
     """
 
     def __init__(self, question_dict: dict, **kwargs) -> None:
         super().__init__(question_dict, **kwargs)
-        self.choices = []
-        self.choice_temp = None
-
-        # Add every choice as a button and track their word lengths
-        self.buttons = []
-        lengths = []
-        for choice in question_dict['choices']:
-            choice_button = QuestionnaireChoiceButton(choice)
-            self.buttons.append(choice_button)
-            self.ids.question_input.add_widget(choice_button)
-            lengths.append(len(choice))
-
-        # Resize proportional to the root of the word lengths
-        total = sum(lengths)
-        for ii, length in enumerate(lengths):
-            self.buttons[ii].size_hint_x = length ** .5 / total
+        self.choices = {}
 
     def assign_dependant(self, question):
         """
@@ -551,17 +722,15 @@ class MultiMultipleChoiceQQuestion(QuestionnaireQuestion):
         if choice in self.choices:
             # Deselect the currently selected button if it has already been chosen
             choice.deselect()
-            self.choices.remove(choice)
+            del self.choices[choice]
 
         else:
             # Set the current answer to the entered button otherwise
             choice.select()
-            self.choices.append(choice)
+            self.choices[choice] = None
 
         # Fill out the answer string again.
-        answer_str = ''
-        for button in self.choices:
-            answer_str += f'{button.text};'
+        answer_str = ''.join(f'{button.text};' for button in self.choices)
 
         # Store this change in answer
         self.change_answer(answer_str)
@@ -577,10 +746,6 @@ class MultiMultipleChoiceQQuestion(QuestionnaireQuestion):
         # Reset the choices variable
         self.choices = None
 
-        # Make all the choice buttons green
-        for choice in self.buttons:
-            choice.background_color = [.7, 1, .7, 1.]
-
         # Do the superclass actions
         super().dependant_lock()
 
@@ -588,21 +753,18 @@ class MultiMultipleChoiceQQuestion(QuestionnaireQuestion):
         """
         Unlock this question when it is locked by another question.
         """
-        # Reset all choice buttons
-        for choice in self.buttons:
-            choice.deselect()
+        # Do the superclass actions, which also restore the answer string of the stored choices
+        super().dependant_unlock()
 
-        # Start with a fresh choices list
-        self.choices = []
+        # Start with a fresh choices set
+        self.choices = {}
         # Only fill it in case there were answers previously
         if self.choice_temp is not None:
             # Loop over the temp answers store
             for choice in self.choice_temp:
                 # Select the choice button
-                self.select_choice(choice)
+                choice.select()
+                self.choices[choice] = None
 
             # Clear the temp variable
             self.choice_temp = None
-
-        # Do the superclass actions
-        super().dependant_unlock()
@@ -21,6 +21,9 @@ Module containing the overall classes and functions for the Questionnaire screen
 """
 from kivy.uix.screenmanager import ScreenManager
 from kivy.uix.boxlayout import BoxLayout
+from kivy.clock import Clock
+import functools
+import weakref
 
 from .screens import PalilaScreen, BackButton, Filler
 from . import questionnaire_questions
@@ -28,6 +31,15 @@ from . import questionnaire_questions
 
 __all__ = ['questionnaire_setup']
 
+# Questionnaire question classes by their type in the input file, e.g. 'FreeNumber' for FreeNumberQQuestion.
+# Only the concrete question types are listed, so base classes like ButtonQQuestion cannot be used as a type.
+QUESTION_TYPES = {'FreeNumber': questionnaire_questions.FreeNumberQQuestion,
+                   'FreeText': questionnaire_questions.FreeTextQQuestion,
+                   'Spinner': questionnaire_questions.SpinnerQQuestion,
+                   'MultipleChoice': questionnaire_questions.MultipleChoiceQQuestion,
+                   'MultiMultipleChoice': questionnaire_questions.MultiMultipleChoiceQQuestion,
+                   }
+
 
 class QuestionnaireScreen(PalilaScreen):
     """
@@ -44,6 +56,8 @@ class QuestionnaireScreen(PalilaScreen):
     ----------
     questionnaire_dict : dict
         Dictionary that defines the questionnaire and its questions.
+    unlock_trigger : kivy.clock.ClockEvent
+        Trigger for the unlock check at the end of the frame, which collapses the checks of multiple answer changes.
     """
 
     def __init__(self, questionnaire_dict: dict, questions: list, *args,
@@ -58,20 +72,31 @@ class QuestionnaireScreen(PalilaScreen):
         self.state_override = state_override
         # Create a link to the question manager from the Kivy code.
         self.question_manager: QQuestionManager = self.ids.question_manager
+        # Create a link to the continue button as well, which is checked on every unlock check.
+        self.continue_bttn = self.ids.continue_bttn
+        # Create the unlock trigger before adding questions, since dependency locks already change answers.
+        self.unlock_trigger = Clock.create_trigger(self.triggered_unlock_check)
+        # Settle the debounced answers before the continue button is acted on.
+        self.continue_bttn.on_release = self.continue_release
 
         # Add the questions from the list to this screen.
+        # The question manager only schedules its layout for the next frame (Layout._trigger_layout), so adding all
+        # questions and fillers here results in a single layout pass once the screen is complete.
         for question in self.questions:
             self.question_manager.add_question(self.questionnaire_dict[question])
 
-        # Fill up the empty space.
-        for _ in range(7 - len(self.questions)):
-            self.question_manager.add_widget(Filler())
+        # Fill up the empty space with a single filler, sized as the number of missing questions.
+        n_filler = 7 - len(self.questions)
+        if n_filler > 0:
+            self.question_manager.add_widget(Filler(size_hint_y=n_filler))
+            # Replace the spacing between separate fillers with bottom padding, so the questions keep the same height.
+            self.question_manager.padding = (0, 0, 0, (n_filler - 1) * self.question_manager.spacing)
 
         # In case it's not the first screen (indicated by the presence of a back_function), set up the back button
         if back_function is not None:
             # First readjust the continue button
-            self.ids.continue_bttn.size_hint_x -= .065
-            self.ids.continue_bttn.pos_hint = {'x': .415, 'y': .015}
+            self.continue_bttn.size_hint_x -= .065
+            self.continue_bttn.pos_hint = {'x': .415, 'y': .015}
             # Create the back button and pass all information to it
             back_button = BackButton()
             back_button.pos_hint = {'x': .35, 'y': .015}
@@ -83,45 +108,92 @@ class QuestionnaireScreen(PalilaScreen):
 
         # Do the unlock check
         self.unlock_check()
-        # Add the borders to all questions
-        [question.border() for question in self.question_manager.questions.values()]
-        # Set the dependency locks for all questions, now that they are part of this screen.
-        [question.set_unlock() for question in self.question_manager.questions.values()]
+        for question in self.question_manager.questions.values():
+            # Add the border to the question
+            question.border()
+            # Set the dependency lock of the question, now that it is part of this screen.
+            question.set_unlock()
 
         # ==============================================================================================================
         # todo: DEPRECATED CODE
         # ---------------------
-        [question.set_dependant() for question in self.question_manager.questions.values()]
+        for question in self.question_manager.questions.values():
+            question.set_dependant()
         # ==============================================================================================================
 
     def unlock_check(self, question_state: bool = None):
         """
         Check for unlocking the continue button.
         """
+        # With the state override, there is nothing to check once the continue button is unlocked.
+        if self.state_override and not self.continue_bttn.disabled:
+            return
+
         if question_state is None:
             question_state = self.question_manager.get_state()
 
         # If all questions are answered and the audio is listened to: unlock the continue button.
         if question_state or self.state_override:
             self.reset_continue_label()
-            self.ids.continue_bttn.unlock()
+            self.continue_bttn.unlock()
 
         else:
             # Otherwise, make sure the continue button is locked.
-            self.ids.continue_bttn.lock()
+            self.continue_bttn.lock()
+
+    def triggered_unlock_check(self, *_):
+        """
+        Check for unlocking the continue button, once for all answer changes in the last frame.
+        """
+        # The question state is not needed with the state override.
+        self.unlock_check(question_state=self.state_override or
+                          (self.question_manager.get_state() and not self.question_manager.disabled))
+
+    def flush_unlock_check(self) -> None:
+        """
+        Run a pending unlock check right away.
+        """
+        # The continue button is up-to-date, unless an unlock check is still pending. In that case, do it right away.
+        if self.unlock_trigger.is_triggered:
+            self.unlock_trigger.cancel()
+            self.triggered_unlock_check()
+
+    def flush_answers(self) -> None:
+        """
+        Run the pending answer changes of all questions right away, followed by the pending unlock check.
+        """
+        for question in self.question_manager.questions.values():
+            question.flush_answer()
+        self.flush_unlock_check()
+
+    def continue_release(self) -> None:
+        """
+        Function for the on_release of the continue button.
+        Only navigates when the continue button is still unlocked after settling the pending answer changes.
+        """
+        self.flush_answers()
+        if not self.continue_bttn.disabled:
+            self.manager.navigate_next()
 
     def on_pre_leave(self, *_):
         """
-        Store all answers before leaving the screen.
+        Store all changed answers before leaving the screen.
         """
-        for qid, answer in self.question_manager.answers.items():
-            self.manager.store_answer(qid, answer)
+        # Make sure answers that were typed just before leaving are included
+        self.flush_answers()
+
+        store_answer = self.manager.store_answer
+        answers = self.question_manager.answers
+        for qid in self.question_manager.changed:
+            store_answer(qid, answers[qid])
+        # All answers are now stored, so reset the changes
+        self.question_manager.changed.clear()
 
     def on_pre_enter(self, *args):
         """
         Unlock the continue button if appropriate.
         """
-        self.unlock_check()
+        self.flush_unlock_check()
         super().on_pre_enter(*args)
 
 
@@ -140,11 +212,17 @@ class QQuestionManager(BoxLayout):
         Dictionary that links the question IDs to the questions.
     answers : dict[str, str]
         Dictionary that stores the answers linked to question IDs.
+    changed : set[str]
+        Set of the question IDs of which the answer changed since the answers were last stored.
+    unanswered : int
+        Number of questions in this manager that do not have an answer.
     """
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.questions = {}
         self.answers = {}
+        self.changed = set()
+        self.unanswered = 0
 
     def add_question(self, question_dict: dict) -> None:
         """
@@ -155,32 +233,29 @@ class QQuestionManager(BoxLayout):
         question_dict : dict
             Dictionary with all the information to construct the question.
         """
-        # Get the question type class.
-        question_type = getattr(questionnaire_questions, f'{question_dict["type"]}QQuestion')
+        # Get the question type class. The type is verified when the experiment is loaded.
+        question_type = QUESTION_TYPES[question_dict['type']]
         # Create the instance of it.
         question_instance: questionnaire_questions.QuestionnaireQuestion = question_type(question_dict)
 
         # Add the instance to the screen and the list.
         self.add_widget(question_instance)
+        # Give the question a direct link to the screen, to avoid .parent.parent chains
+        question_instance.screen = weakref.proxy(self.parent)
 
         # Link the ID to the instance
         self.questions[question_dict['id']] = question_instance
         # Create a spot in the answer dictionary
         self.answers[question_dict['id']] = ''
+        # A new question starts out unanswered
+        self.unanswered += 1
 
     def get_state(self):
         """
         Get the completion state of this questionnaire.
         """
-        # Start a variable to store the total state
-        total_state = True
-
-        # Loop over all questions
-        for qid, answer in self.answers.items():
-            total_state = total_state and bool(answer)
-
-        # Return the final state
-        return total_state
+        # The unanswered counter is kept up to date by change_answer, so no need to loop over the answers.
+        return not self.unanswered
 
     def change_answer(self, question_id: str, answer: str) -> None:
         """
@@ -193,9 +268,15 @@ class QQuestionManager(BoxLayout):
         answer : str
             The answer string to update to.
         """
+        # Update the unanswered counter when the answer switches between empty and non-empty.
+        was_complete = not self.unanswered
+        self.unanswered += bool(self.answers[question_id]) - bool(answer)
+
         self.answers[question_id] = answer
-        # Have the QuestionnaireScreen check the state
-        self.parent.unlock_check(question_state=self.get_state() and not self.disabled)
+        self.changed.add(question_id)
+        # Have the QuestionnaireScreen check the state at the end of this frame, only if the completion state changed.
+        if was_complete != (not self.unanswered):
+            self.parent.unlock_trigger()
 
 
 def questionnaire_setup(questionnaire_dict: dict, manager: ScreenManager, state_override: bool,
@@ -208,7 +289,7 @@ def questionnaire_setup(questionnaire_dict: dict, manager: ScreenManager, state_
     questionnaire_dict : dict
         Dictionary that defines the questionnaire and its questions.
     manager : PalilaScreenManager
-        ScreenManager to add the questionnaire to.
+        ScreenManager to add the questionnaire to. The screens are registered to it to be created when first needed.
     state_override : bool
         Override variable to be passed to the questionnaire screens.
     part : str
@@ -219,38 +300,25 @@ def questionnaire_setup(questionnaire_dict: dict, manager: ScreenManager, state_
         manager.get_screen(questionnaire_dict['previous']).next_screen = questionnaire_dict['next']
 
     else:
+        # Get the distribution of the questions over the screens
+        screen_dict = questionnaire_dict['screen dict']
         # Extract the screen numbers from the question distribution
-        screen_nums = sorted(questionnaire_dict['screen dict'].keys())
+        screen_nums = sorted(screen_dict.keys())
+        # Create the names of the questionnaire screens once
+        screen_names = [f'{part}-questionnaire-{ii + 1}' for ii in range(len(screen_nums))]
+        # The first screen follows the defined previous screen, the others follow the previous questionnaire screen
+        previous_screens = [questionnaire_dict['previous']] + screen_names[:-1]
+        # The last screen continues into the defined next screen, the others into the next questionnaire screen
+        next_screens = screen_names[1:] + [questionnaire_dict['next']]
+
         # Loop over those numbers
         for ii, screen_num in enumerate(screen_nums):
-            if ii:
-                # When this is not the last screen, define the previous indexed screen as previous to this one
-                previous_screen = f'{part}-questionnaire-{ii}'
-            else:
-                # In case this is the first questionnaire screen, set the previous screen to the one defined
-                # in the setup dictionary
-                previous_screen = questionnaire_dict['previous']
-
-            # Check if this is the last questionnaire screen.
-            if screen_num < max(screen_nums):
-                # If not, define the next one by the index + 2
-                next_screen = f'{part}-questionnaire-{ii + 2}'
-            else:
-                # The last screen continues into the defined next screen.
-                next_screen = questionnaire_dict['next']
-
-            if ii:
-                # Create a new questionnaire screen with the necessary parameters
-                new_screen = QuestionnaireScreen(questionnaire_dict, questionnaire_dict['screen dict'][screen_num],
-                                                 previous_screen, next_screen,
-                                                 back_function=manager.navigate_previous, state_override=state_override,
-                                                 name=f'{part}-questionnaire-{ii + 1}',
-                                                 )
-            else:
-                # Special case for the first questionnaire screen
-                new_screen = QuestionnaireScreen(questionnaire_dict, questionnaire_dict['screen dict'][screen_num],
-                                                 previous_screen, next_screen,
-                                                 state_override=state_override, name=f'{part}-questionnaire-{ii + 1}',
-                                                 )
-            # Add the questionnaire screen to the ScreenManager
-            manager.add_widget(new_screen)
+            # Set up the construction of a new questionnaire screen with the necessary parameters.
+            # The first questionnaire screen does not get a back button.
+            screen_factory = functools.partial(QuestionnaireScreen, questionnaire_dict, screen_dict[screen_num],
+                                               previous_screens[ii], next_screens[ii],
+                                               back_function=manager.navigate_previous if ii else None,
+                                               state_override=state_override, name=screen_names[ii],
+                                               )
+            # Register the questionnaire screen with the ScreenManager, which only creates it when it is first needed
+            manager.register_lazy(screen_names[ii], screen_factory)
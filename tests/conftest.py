@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the tests of the GUI package.
+"""
+import importlib
+import os
+
+import pytest
+
+
+# The kv files of the GUI package are loaded relative to the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='session')
+def gui():
+    """
+    The GUI package, imported from the repository root with the rules of the general screens loaded.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        # Keep Kivy from parsing the pytest command line arguments
+        mp.setenv('KIVY_NO_ARGS', '1')
+        pytest.importorskip('kivy')
+        from kivy.lang import Builder
+
+        mp.chdir(ROOT)
+        package = importlib.import_module('GUI')
+        # The rules of the general screens are normally loaded by the PalilaApp
+        Builder.load_file('GUI/palila.kv')
+
+    yield package
+
+    Builder.unload_file('GUI/palila.kv')
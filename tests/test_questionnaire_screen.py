@@ -0,0 +1,104 @@
+"""
+Tests for the questionnaire screens and the verification of the questionnaire questions.
+"""
+import pytest
+
+
+@pytest.fixture
+def screen(gui):
+    """
+    A questionnaire screen with a single free text question, added to a ScreenManager that records the stored answers
+    and navigation instead of passing them on.
+    """
+    from kivy.uix.screenmanager import ScreenManager
+
+    class RecordingManager(ScreenManager):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.stored = {}
+            self.navigated = False
+
+        def store_answer(self, key: str, value: str) -> None:
+            self.stored[key] = value
+
+        def navigate_next(self) -> None:
+            self.navigated = True
+
+    questionnaire_dict = {'question 1': {'id': 'q1', 'text': 'Question', 'type': 'FreeText'}, 'dependency dag': {}}
+    manager = RecordingManager()
+    new_screen = gui.questionnaire_screen.QuestionnaireScreen(questionnaire_dict, ['question 1'], 'previous', 'next',
+                                                              name='questionnaire')
+    manager.add_widget(new_screen)
+    return new_screen
+
+
+def test_typing_then_leaving_stores_the_answer(screen):
+    question = screen.question_manager.questions['q1']
+    question.input_bar.text = 'answer'
+
+    # Leave the screen right away, before the debounced answer change had the chance to run
+    screen.on_pre_leave()
+
+    assert screen.manager.stored == {'q1': 'answer'}
+    assert not screen.question_manager.changed
+
+
+def test_clearing_then_continuing_does_not_navigate(screen):
+    question = screen.question_manager.questions['q1']
+    question.input_bar.text = 'answer'
+    screen.flush_answers()
+    assert not screen.continue_bttn.disabled
+
+    # Clear the answer and press continue right away
+    question.input_bar.text = ''
+    screen.continue_bttn.dispatch('on_release')
+
+    assert screen.continue_bttn.disabled
+    assert not screen.manager.navigated
+
+
+@pytest.fixture
+def verify_questionnaire(gui):
+    """
+    Function to run the load-time verification on a questionnaire with the given questions and screen split.
+    """
+    def verify(questions: dict, screen_dict: dict) -> None:
+        questionnaire_dict = {'questions': list(questions), 'screen dict': screen_dict, **questions}
+        gui.file_system.PalilaExperiment._verify_questionnaire(questionnaire_dict, 'main')
+
+    return verify
+
+
+def test_base_class_is_not_a_question_type(verify_questionnaire):
+    questions = {'question 1': {'id': 'q1', 'text': 'Question', 'type': 'Button', 'choices': ['a', 'b']}}
+
+    with pytest.raises(SyntaxError, match='unknown question type'):
+        verify_questionnaire(questions, {'1': ['question 1']})
+
+
+def test_choice_question_requires_choices(verify_questionnaire):
+    questions = {'question 1': {'id': 'q1', 'text': 'Question', 'type': 'MultipleChoice'}}
+
+    with pytest.raises(SyntaxError, match='"choices"'):
+        verify_questionnaire(questions, {'1': ['question 1']})
+
+
+@pytest.mark.parametrize('unlocking_type, screen_dict, message', [
+    ('MultipleChoice', {'1': ['question 1'], '2': ['question 2']}, 'not on the same screen'),
+    ('MultiMultipleChoice', {'1': ['question 1', 'question 2']}, 'cannot unlock'),
+])
+def test_unlocked_by_is_verified(verify_questionnaire, unlocking_type, screen_dict, message):
+    questions = {'question 1': {'id': 'q1', 'text': 'Question', 'type': unlocking_type, 'choices': ['a', 'b']},
+                 'question 2': {'id': 'q2', 'text': 'Question', 'type': 'FreeText',
+                                'unlocked by': 'q1', 'unlock condition': 'a'}}
+
+    with pytest.raises(SyntaxError, match=message):
+        verify_questionnaire(questions, screen_dict)
+
+
+def test_valid_questionnaire_passes(verify_questionnaire):
+    questions = {'question 1': {'id': 'q1', 'text': 'Question', 'type': 'MultipleChoice', 'choices': ['a', 'b']},
+                 'question 2': {'id': 'q2', 'text': 'Question', 'type': 'FreeText',
+                                'unlocked by': 'q1', 'unlock condition': 'a'}}
+
+    verify_questionnaire(questions, {'1': ['question 1', 'question 2']})